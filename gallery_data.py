@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Shared CSV loading and validation for the gallery generator scripts.
+
+Both generate_gallery.py and generate_gallery_v3.py import from here, so a
+process that runs the two generators back to back parses and validates the
+CSV (and scans the image directories) exactly once.
+"""
+
+import csv
+import functools
+import os
+from collections import namedtuple
+
+LOCATIONS = ('boston', 'delaware', 'misc')
+REQUIRED_FIELDS = ('title', 'location', 'filename', 'medium', 'price', 'description')
+VALID_AVAILABILITY = ('available', 'out_of_stock', 'temporarily_unavailable', 'original_only')
+
+# Lightweight row type: C-level attribute access and far less memory than
+# the per-row dict it replaces. availability defaults to 'available' for
+# CSVs without the column, so the same rows serve both generators.
+Painting = namedtuple('Painting', ('title', 'location', 'filename', 'medium',
+                                   'price', 'description', 'featured',
+                                   'image_url', 'availability'))
+
+@functools.lru_cache(maxsize=4)
+def load_validated_paintings(csv_path, fail_fast=False):
+    """Read, validate, and partition the CSV in one streaming pass.
+
+    Returns (by_location, featured) on success, or None when the CSV is
+    missing, empty, or any row fails validation. With fail_fast=True the
+    first hard error aborts the read immediately instead of reporting
+    every problem in the file. Results are memoized per argument pair for
+    the lifetime of the process.
+    """
+    if not os.path.exists(csv_path):
+        print(f"❌ Error: {csv_path} not found!")
+        return None
+
+    # One directory read per location instead of a stat syscall per painting.
+    # On a high-latency mount (CI blob storage, SMB) set GALLERY_PARALLEL_STAT
+    # to check the images with a thread pool instead: os.stat releases the
+    # GIL, so the per-file round trips overlap rather than serialize.
+    parallel_stat = bool(os.environ.get('GALLERY_PARALLEL_STAT'))
+    existing = {}
+    if not parallel_stat:
+        for loc in LOCATIONS:
+            try:
+                existing[loc] = {entry.name for entry in os.scandir(f"images/paintings/{loc}")}
+            except FileNotFoundError:
+                existing[loc] = set()
+
+    by_location = {loc: [] for loc in LOCATIONS}
+    featured = []
+    pending_stat = []
+    total = 0
+    valid = True
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            print(f"✅ Read 0 paintings from {csv_path}")
+            return None
+
+        # Resolve column positions once; per-row access is then plain list
+        # indexing with no per-row dict built by DictReader.
+        columns = {name: pos for pos, name in enumerate(header)}
+        i_title = columns['title']
+        i_location = columns['location']
+        i_filename = columns['filename']
+        i_medium = columns['medium']
+        i_price = columns['price']
+        i_description = columns['description']
+        i_featured = columns.get('featured', -1)
+        i_availability = columns.get('availability', -1)
+
+        i = 0
+        for row in reader:
+            if not row:
+                continue  # blank line; csv.DictReader used to skip these
+            i += 1
+            location = row[i_location].strip().lower()
+            filename = row[i_filename].strip()
+            painting = Painting(
+                title=row[i_title].strip(),
+                location=location,
+                filename=filename,
+                medium=row[i_medium].strip(),
+                price=row[i_price].strip(),
+                description=row[i_description].strip(),
+                featured=i_featured >= 0 and row[i_featured].strip().lower() == 'yes',
+                # Computed once here; reused by every page render.
+                image_url=f"images/paintings/{location}/{filename}",
+                availability=row[i_availability].strip().lower() if i_availability >= 0 else 'available',
+            )
+            total += 1
+
+            for field in REQUIRED_FIELDS:
+                if not getattr(painting, field):
+                    print(f"❌ Row {i}: Missing {field}")
+                    valid = False
+
+            group = by_location.get(painting.location)
+            if group is None:
+                print(f"❌ Row {i}: Invalid location '{painting.location}'")
+                valid = False
+
+            if painting.availability not in VALID_AVAILABILITY:
+                print(f"⚠️  Row {i}: Invalid availability '{painting.availability}' - defaulting to 'available'")
+                painting = painting._replace(availability='available')
+
+            if parallel_stat:
+                pending_stat.append((i, painting))
+            elif painting.filename not in existing.get(painting.location, ()):
+                print(f"⚠️  Row {i}: Image not found: images/paintings/{painting.location}/{painting.filename}")
+                valid = False
+
+            if fail_fast and not valid:
+                print("\n❌ Stopping at first error (fast mode). Fix issues and try again.")
+                return None
+
+            if group is not None:
+                group.append(painting)
+            if painting.featured:
+                featured.append(painting)
+
+    if pending_stat:
+        from concurrent.futures import ThreadPoolExecutor  # opt-in path only
+        with ThreadPoolExecutor(max_workers=32) as ex:
+            checks = ex.map(os.path.exists, [p.image_url for _, p in pending_stat])
+            for (i, painting), found in zip(pending_stat, checks):
+                if not found:
+                    print(f"⚠️  Row {i}: Image not found: {painting.image_url}")
+                    valid = False
+
+    print(f"✅ Read {total} paintings from {csv_path}")
+    if total == 0:
+        return None
+    if not valid:
+        print("\n❌ Fix issues and try again.")
+        return None
+
+    print("✅ All data validated!")
+    return by_location, featured
@@ -6,10 +6,14 @@ Generates TWO pages:
   - gallery.html: Full collection with tabbed navigation
 """
 
-import csv
 import os
+import re
+import shutil
+import sys
 from pathlib import Path
 
+from gallery_data import LOCATIONS, load_validated_paintings
+
 # Configuration
 CSV_FILE = "paintings-data.csv"
 INDEX_FILE = "index.html"
@@ -17,113 +21,105 @@ GALLERY_FILE = "gallery.html"
 INDEX_BACKUP = "index.html.backup"
 GALLERY_BACKUP = "gallery.html.backup"
 
-def read_paintings_data(csv_path):
-    """Read painting data from CSV file."""
-    paintings = []
-    
-    if not os.path.exists(csv_path):
-        print(f"❌ Error: {csv_path} not found!")
-        return None
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            paintings.append({
-                'title': row['title'].strip(),
-                'location': row['location'].strip().lower(),
-                'filename': row['filename'].strip(),
-                'medium': row['medium'].strip(),
-                'price': row['price'].strip(),
-                'description': row['description'].strip(),
-                'featured': row.get('featured', '').strip().lower() == 'yes'
-            })
-    
-    print(f"✅ Read {len(paintings)} paintings from {csv_path}")
-    return paintings
+# Compiled once: each pattern captures a whole section so the replacement is
+# a single regex pass instead of two marker scans plus slice-concatenation.
+# Patterns are bytes-level so page content never has to be decoded: only the
+# small generated fragments get encoded into the raw buffer.
+FEATURED_SECTION_RE = re.compile(
+    rb'    <!-- Featured Works Section -->.*?(?=    <!-- Contact Section -->)',
+    re.DOTALL)
+TABBED_SECTION_RE = re.compile(
+    rb'    <!-- Tabbed Gallery Section -->.*?(?=    <!-- Footer -->)',
+    re.DOTALL)
+HERO_PAINTING_RE = re.compile(rb'\.hero-painting-([123])\s*\{[^}]*\}')
 
-def validate_paintings_data(paintings):
-    """Validate data and image files."""
-    valid = True
-    
-    for i, painting in enumerate(paintings, 1):
-        required = ['title', 'location', 'filename', 'medium', 'price', 'description']
-        for field in required:
-            if not painting.get(field):
-                print(f"❌ Row {i}: Missing {field}")
-                valid = False
-        
-        if painting['location'] not in ['boston', 'delaware', 'misc']:
-            print(f"❌ Row {i}: Invalid location '{painting['location']}'")
-            valid = False
-        
-        image_path = f"images/paintings/{painting['location']}/{painting['filename']}"
-        if not os.path.exists(image_path):
-            print(f"⚠️  Row {i}: Image not found: {image_path}")
-            valid = False
-    
-    if valid:
-        print("✅ All data validated!")
-    return valid
+# Card literal segments, hoisted once at import time. generate_painting_card
+# interleaves them with row values via a single list.extend, so a card costs
+# no per-call format parsing -- just the terminal C-level join.
+CARD_HEAD = ('            <div class="painting-card">\n'
+             '                <div class="painting-image" style="background-image: url(\'')
+CARD_AFTER_IMAGE = ('\'); background-size: cover; background-position: center;"></div>\n'
+                    '                <div class="painting-info">\n'
+                    '                    <h3>')
+CARD_AFTER_TITLE = ('</h3>\n'
+                    '                    <p class="medium">')
+CARD_AFTER_MEDIUM = ('</p>\n'
+                     '                    <p class="description">')
+CARD_AFTER_DESCRIPTION = ('</p>\n'
+                          '                    <div class="price-tag">From $')
+CARD_AFTER_PRICE = ('</div>\n'
+                    '                    <button class="order-button" onclick="openOrderModal(\'')
+CARD_AFTER_ORDER_TITLE = "', "
+CARD_TAIL = (')">ORDER PRINT</button>\n'
+             '                </div>\n'
+             '            </div>')
+
+def create_backup(src, dst):
+    """Snapshot src to dst via hard link: one metadata syscall, no data copy."""
+    try:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)  # cross-device moves or filesystems without links
 
-def generate_painting_card(painting):
-    """Generate HTML for a painting card."""
-    return f'''            <div class="painting-card">
-                <div class="painting-image" style="background-image: url('images/paintings/{painting['location']}/{painting['filename']}'); background-size: cover; background-position: center;"></div>
-                <div class="painting-info">
-                    <h3>{painting['title']}</h3>
-                    <p class="medium">{painting['medium']}</p>
-                    <p class="description">{painting['description']}</p>
-                    <div class="price-tag">From ${painting['price']}</div>
-                    <button class="order-button" onclick="openOrderModal('{painting['title']}', {painting['price']})">ORDER PRINT</button>
-                </div>
-            </div>'''
+def atomic_write(path, data):
+    """Write bytes to path via a temp file and atomic rename.
 
-def generate_featured_section(paintings):
+    Crash mid-write leaves the old file intact, and the hard-linked backup
+    created by create_backup is never mutated in place.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def generate_painting_card(painting, out):
+    """Append the HTML fragments for one painting card to the out list."""
+    out.extend((
+        CARD_HEAD, painting.image_url,
+        CARD_AFTER_IMAGE, painting.title,
+        CARD_AFTER_TITLE, painting.medium,
+        CARD_AFTER_MEDIUM, painting.description,
+        CARD_AFTER_DESCRIPTION, painting.price,
+        CARD_AFTER_PRICE, painting.title,
+        CARD_AFTER_ORDER_TITLE, painting.price,
+        CARD_TAIL,
+    ))
+
+def generate_featured_section(featured):
     """Generate featured works HTML for index.html."""
-    featured = [p for p in paintings if p['featured']]
-    
     if not featured:
         print("⚠️  No featured paintings. Add 'yes' to featured column for 4-6 paintings.")
         return ""
-    
-    cards = '\n'.join([generate_painting_card(p) for p in featured])
-    
-    html = f'''    <!-- Featured Works Section -->
+
+    # Stream all fragments into one list and join exactly once at the end.
+    parts = ['''    <!-- Featured Works Section -->
     <section class="featured-gallery" id="featured">
         <h2>Featured Works</h2>
         <p class="section-subtitle">A curated selection of signature pieces</p>
         <div class="featured-grid">
-{cards}
+''']
+    for i, p in enumerate(featured):
+        if i:
+            parts.append('\n')
+        generate_painting_card(p, parts)
+    parts.append('''
         </div>
         <div class="view-all-cta">
             <a href="gallery.html" class="view-all-button">VIEW COMPLETE COLLECTION</a>
         </div>
     </section>
-'''
-    
+''')
+
     print(f"✅ Generated featured section with {len(featured)} paintings")
-    return html
+    return ''.join(parts)
 
-def generate_tabbed_gallery(paintings):
+def generate_tabbed_gallery(by_location):
     """Generate tabbed gallery HTML for gallery.html."""
-    by_location = {
-        'boston': [p for p in paintings if p['location'] == 'boston'],
-        'delaware': [p for p in paintings if p['location'] == 'delaware'],
-        'misc': [p for p in paintings if p['location'] == 'misc']
-    }
-    
-    tabs = []
-    for loc in ['boston', 'delaware', 'misc']:
-        if not by_location[loc]:
-            continue
-        cards = '\n'.join([generate_painting_card(p) for p in by_location[loc]])
-        tabs.append(f'''        <div class="tab-content" id="{loc}-tab" style="display: none;">
-            <div class="gallery-grid">
-{cards}
-            </div>
-        </div>''')
-    
-    html = f'''    <!-- Tabbed Gallery Section -->
+    # One shared fragment list for the whole section; a single terminal join
+    # replaces the per-tab and per-card join passes.
+    parts = ['''    <!-- Tabbed Gallery Section -->
     <div class="gallery-container">
         <div class="tab-navigation">
             <button class="tab-button active" onclick="showTab('boston')">Boston, MA</button>
@@ -131,68 +127,75 @@ def generate_tabbed_gallery(paintings):
             <button class="tab-button" onclick="showTab('misc')">Other Pieces</button>
         </div>
 
-{chr(10).join(tabs)}
-    </div>
-'''
-    
+''']
+    tabs_written = 0
+    for loc in LOCATIONS:
+        if not by_location[loc]:
+            continue
+        if tabs_written:
+            parts.append('\n')
+        tabs_written += 1
+        parts.extend(('        <div class="tab-content" id="', loc,
+                      '-tab" style="display: none;">\n            <div class="gallery-grid">\n'))
+        for i, p in enumerate(by_location[loc]):
+            if i:
+                parts.append('\n')
+            generate_painting_card(p, parts)
+        parts.append('\n            </div>\n        </div>')
+    parts.append('\n    </div>\n')
+
     counts = {k: len(v) for k, v in by_location.items()}
     print(f"✅ Generated tabbed gallery: Boston ({counts['boston']}), Delaware ({counts['delaware']}), Other ({counts['misc']})")
-    return html
+    return ''.join(parts)
 
-def update_index_html(featured_html, paintings):
+def update_index_html(featured_html, featured):
     """Update index.html with featured works and hero backgrounds."""
     if not os.path.exists(INDEX_FILE):
         print(f"❌ {INDEX_FILE} not found!")
         return False
     
-    import shutil
-    shutil.copy(INDEX_FILE, INDEX_BACKUP)
-    print(f"✅ Created backup: {INDEX_BACKUP}")
-    
-    with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+    # Work on the raw bytes; only the generated fragments are encoded.
+    with open(INDEX_FILE, 'rb') as f:
         content = f.read()
+    original = content
     
-    # Update featured works section
-    marker = '    <!-- Featured Works Section -->'
-    end_marker = '    <!-- Contact Section -->'
-    
-    start = content.find(marker)
-    end = content.find(end_marker)
-    
-    if start == -1 or end == -1:
+    # Update featured works section in a single compiled-regex pass
+    featured_bytes = featured_html.encode('utf-8') + b'\n'
+    content, replaced = FEATURED_SECTION_RE.subn(
+        lambda m: featured_bytes, content, count=1)
+    if replaced != 1:
         print("❌ Could not find markers in index.html")
         return False
     
-    content = content[:start] + featured_html + '\n' + content[end:]
-    
-    # Update hero background paintings with actual featured paintings
-    featured = [p for p in paintings if p['featured']]
+    # Update hero background paintings with actual featured paintings.
+    # All .hero-painting-N blocks are rewritten in one regex pass instead of
+    # re-scanning the whole file per hero slot.
     if featured:
         # Take up to 3 featured paintings for hero rotation
-        hero_paintings = featured[:3]
-        
-        for i, painting in enumerate(hero_paintings, 1):
-            old_style = f'.hero-painting-{i} {{\n            background: linear-gradient'
-            new_style = f'.hero-painting-{i} {{\n            background-image: url(\'images/paintings/{painting["location"]}/{painting["filename"]}\');\n            background: linear-gradient'
-            
-            # Find and replace the hero painting style
-            placeholder = f'.hero-painting-{i} {{'
-            if placeholder in content:
-                # Find the closing brace for this class
-                start_pos = content.find(placeholder)
-                end_pos = content.find('}', start_pos)
-                old_block = content[start_pos:end_pos+1]
-                new_block = f'''.hero-painting-{i} {{
-            background-image: url('images/paintings/{painting["location"]}/{painting["filename"]}');
+        hero_map = {str(i).encode('ascii'): p for i, p in enumerate(featured[:3], 1)}
+
+        def render_hero(match):
+            painting = hero_map.get(match.group(1))
+            if painting is None:
+                return match.group(0)
+            return f'''.hero-painting-{match.group(1).decode('ascii')} {{
+            background-image: url('{painting.image_url}');
             background-size: cover;
             background-position: center;
-        }}'''
-                content = content.replace(old_block, new_block)
-        
-        print(f"✅ Updated hero with {len(hero_paintings)} featured painting backgrounds")
-    
-    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
-        f.write(content)
+        }}'''.encode('utf-8')
+
+        content = HERO_PAINTING_RE.sub(render_hero, content)
+        print(f"✅ Updated hero with {len(hero_map)} featured painting backgrounds")
+    
+    # No-op runs leave the file untouched so mtime-based watchers
+    # (deploy hooks, git status churn) see nothing to do.
+    if content == original:
+        print(f"• {INDEX_FILE} unchanged, skipping write")
+        return True
+
+    create_backup(INDEX_FILE, INDEX_BACKUP)
+    print(f"✅ Created backup: {INDEX_BACKUP}")
+    atomic_write(INDEX_FILE, content)
     
     print(f"✅ Updated {INDEX_FILE}")
     return True
@@ -203,27 +206,23 @@ def update_gallery_html(gallery_html):
         print(f"❌ {GALLERY_FILE} not found!")
         return False
     
-    import shutil
-    shutil.copy(GALLERY_FILE, GALLERY_BACKUP)
-    print(f"✅ Created backup: {GALLERY_BACKUP}")
-    
-    with open(GALLERY_FILE, 'r', encoding='utf-8') as f:
+    with open(GALLERY_FILE, 'rb') as f:
         content = f.read()
     
-    marker = '    <!-- Tabbed Gallery Section -->'
-    end_marker = '    <!-- Footer -->'
-    
-    start = content.find(marker)
-    end = content.find(end_marker)
-    
-    if start == -1 or end == -1:
+    gallery_bytes = gallery_html.encode('utf-8') + b'\n'
+    new_content, replaced = TABBED_SECTION_RE.subn(
+        lambda m: gallery_bytes, content, count=1)
+    if replaced != 1:
         print("❌ Could not find markers in gallery.html")
         return False
     
-    new_content = content[:start] + gallery_html + '\n' + content[end:]
-    
-    with open(GALLERY_FILE, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    if new_content == content:
+        print(f"• {GALLERY_FILE} unchanged, skipping write")
+        return True
+
+    create_backup(GALLERY_FILE, GALLERY_BACKUP)
+    print(f"✅ Created backup: {GALLERY_BACKUP}")
+    atomic_write(GALLERY_FILE, new_content)
     
     print(f"✅ Updated {GALLERY_FILE}")
     return True
@@ -235,43 +234,37 @@ def main():
     print("  Two-Page System: Featured + Full Gallery")
     print("="*60 + "\n")
     
-    # Read and validate
-    paintings = read_paintings_data(CSV_FILE)
-    if not paintings:
-        return
-    
-    print("\n--- Validating Data ---")
-    if not validate_paintings_data(paintings):
-        print("\n❌ Fix issues and try again.")
+    # Read, validate, and partition in one streaming pass
+    # (--fast aborts at the first validation error instead of a full report)
+    loaded = load_validated_paintings(CSV_FILE, fail_fast='--fast' in sys.argv)
+    if loaded is None:
         return
-    
+    by_location, featured = loaded
+
     # Generate HTML
     print("\n--- Generating HTML ---")
-    featured_html = generate_featured_section(paintings)
-    gallery_html = generate_tabbed_gallery(paintings)
-    
+    featured_html = generate_featured_section(featured)
+    gallery_html = generate_tabbed_gallery(by_location)
+
     # Update files
     print("\n--- Updating Files ---")
-    if not update_index_html(featured_html, paintings):
+    if not update_index_html(featured_html, featured):
         return
     if not update_gallery_html(gallery_html):
         return
-    
-    # Summary
-    featured_count = sum(1 for p in paintings if p['featured'])
-    boston = sum(1 for p in paintings if p['location'] == 'boston')
-    delaware = sum(1 for p in paintings if p['location'] == 'delaware')
-    misc = sum(1 for p in paintings if p['location'] == 'misc')
-    
+
+    # Summary (counts fall out of the partition; no extra passes)
+    total = sum(len(group) for group in by_location.values())
+
     print("\n" + "="*60)
     print("✅ SUCCESS! Both pages updated.")
     print("="*60)
     print(f"\n📊 Summary:")
-    print(f"   • Total paintings: {len(paintings)}")
-    print(f"   • Featured (index.html): {featured_count}")
-    print(f"   • Boston, MA: {boston}")
-    print(f"   • Delaware, OH: {delaware}")
-    print(f"   • Other Pieces: {misc}")
+    print(f"   • Total paintings: {total}")
+    print(f"   • Featured (index.html): {len(featured)}")
+    print(f"   • Boston, MA: {len(by_location['boston'])}")
+    print(f"   • Delaware, OH: {len(by_location['delaware'])}")
+    print(f"   • Other Pieces: {len(by_location['misc'])}")
     print(f"\n📁 Files:")
     print(f"   • {INDEX_FILE} - Featured works only")
     print(f"   • {GALLERY_FILE} - Full collection with tabs")
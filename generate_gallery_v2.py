@@ -5,13 +5,19 @@ Generates Featured Works section + Tabbed Gallery (Boston, MA | Delaware, OH | O
 """
 
 import csv
+import hashlib
+import json
 import os
+import shutil
+import sys
 from pathlib import Path
 
 # Configuration
 CSV_FILE = "paintings-data.csv"
 HTML_FILE = "index.html"
 BACKUP_FILE = "index.html.backup"
+CACHE_FILE = ".gallery_cache.json"
+CACHE_MAX_ENTRIES = 8
 
 # Category display names
 CATEGORY_NAMES = {
@@ -20,208 +26,25 @@ CATEGORY_NAMES = {
     'misc': 'Other Pieces'
 }
 
-def read_paintings_data(csv_path):
-    """Read painting data from CSV file."""
-    paintings = []
-    
-    if not os.path.exists(csv_path):
-        print(f"❌ Error: {csv_path} not found!")
-        print("Please create the CSV file with your painting data first.")
-        return None
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            paintings.append({
-                'title': row['title'].strip(),
-                'location': row['location'].strip().lower(),
-                'filename': row['filename'].strip(),
-                'medium': row['medium'].strip(),
-                'price': row['price'].strip(),
-                'description': row['description'].strip(),
-                'featured': row.get('featured', '').strip().lower() == 'yes'
-            })
-    
-    print(f"✅ Read {len(paintings)} paintings from {csv_path}")
-    return paintings
-
-def validate_paintings_data(paintings):
-    """Validate that all required data is present and image files exist."""
-    valid = True
-    
-    for i, painting in enumerate(paintings, 1):
-        # Check required fields
-        required_fields = ['title', 'location', 'filename', 'medium', 'price', 'description']
-        for field in required_fields:
-            if not painting.get(field):
-                print(f"❌ Row {i}: Missing {field}")
-                valid = False
-        
-        # Validate location
-        if painting['location'] not in ['boston', 'delaware', 'misc']:
-            print(f"❌ Row {i}: Invalid location '{painting['location']}' (must be boston, delaware, or misc)")
-            valid = False
-        
-        # Check if image file exists
-        image_path = f"images/paintings/{painting['location']}/{painting['filename']}"
-        if not os.path.exists(image_path):
-            print(f"⚠️  Row {i}: Image not found: {image_path}")
-            print(f"   Make sure the file exists and the filename in CSV matches exactly!")
-            valid = False
-    
-    if valid:
-        print("✅ All paintings data validated successfully!")
-    
-    return valid
-
-def generate_painting_card(painting, card_class="painting-card"):
-    """Generate HTML for a single painting card."""
-    return f'''
-            <div class="{card_class}">
-                <div class="painting-image" style="background-image: url('images/paintings/{painting['location']}/{painting['filename']}'); background-size: cover; background-position: center;"></div>
-                <div class="painting-info">
-                    <h3>{painting['title']}</h3>
-                    <p class="medium">{painting['medium']}</p>
-                    <p class="description">{painting['description']}</p>
-                    <div class="price-tag">From ${painting['price']}</div>
-                    <button class="order-button" onclick="openOrderModal('{painting['title']}', {painting['price']})">ORDER PRINT</button>
-                </div>
-            </div>'''
-
-def generate_featured_section(paintings):
-    """Generate HTML for Featured Works section."""
-    featured = [p for p in paintings if p['featured']]
-    
-    if not featured:
-        print("⚠️  No featured paintings found. Skipping featured section.")
-        return ""
-    
-    cards_html = '\n'.join([generate_painting_card(p, "painting-card featured-card") for p in featured])
-    
-    section_html = f'''
-    <!-- Featured Works Section -->
-    <section class="featured-gallery">
-        <h2>Featured Works</h2>
-        <div class="featured-grid">
-{cards_html}
-        </div>
-    </section>
-'''
-    
-    print(f"✅ Generated Featured Works section with {len(featured)} paintings")
-    return section_html
+# Valid location keys, hoisted so per-row checks don't rebuild a list
+VALID_LOCATIONS = frozenset(CATEGORY_NAMES)
 
-def generate_tabbed_gallery(paintings):
-    """Generate HTML for tabbed gallery organized by location."""
-    
-    # Group paintings by location
-    by_location = {
-        'boston': [p for p in paintings if p['location'] == 'boston'],
-        'delaware': [p for p in paintings if p['location'] == 'delaware'],
-        'misc': [p for p in paintings if p['location'] == 'misc']
-    }
-    
-    # Generate tab content for each category
-    tab_contents = []
-    for loc_key in ['boston', 'delaware', 'misc']:
-        paintings_list = by_location[loc_key]
-        if not paintings_list:
-            continue
-            
-        cards_html = '\n'.join([generate_painting_card(p) for p in paintings_list])
-        
-        tab_contents.append(f'''
-            <div class="tab-content" id="{loc_key}-tab" style="display: none;">
-                <div class="gallery-grid">
-{cards_html}
-                </div>
-            </div>''')
-    
-    # Combine into full gallery section
-    gallery_html = f'''
-    <!-- Tabbed Gallery Section -->
-    <section class="gallery" id="gallery">
-        <h2>Browse Collection</h2>
-        
-        <div class="tab-navigation">
-            <button class="tab-button active" onclick="showTab('boston')">Boston, MA</button>
-            <button class="tab-button" onclick="showTab('delaware')">Delaware, OH</button>
-            <button class="tab-button" onclick="showTab('misc')">Other Pieces</button>
-        </div>
+# HTML escape map, precomputed so each field is escaped in one C-level
+# str.translate pass instead of chained .replace calls
+ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;',
+                              '"': '&quot;', "'": '&#39;'})
 
-{''.join(tab_contents)}
-    </section>
-'''
-    
-    counts = {k: len(v) for k, v in by_location.items()}
-    print(f"✅ Generated tabbed gallery: Boston ({counts['boston']}), Delaware ({counts['delaware']}), Other ({counts['misc']})")
-    
-    return gallery_html
+# Required CSV columns, hoisted out of the per-row validation loop
+REQUIRED_FIELDS = ('title', 'location', 'filename', 'medium', 'price', 'description')
 
-def update_html_file(html_file, featured_html, gallery_html):
-    """Update the index.html file with new gallery content."""
-    
-    # Create backup
-    if os.path.exists(html_file):
-        import shutil
-        shutil.copy(html_file, BACKUP_FILE)
-        print(f"✅ Created backup: {BACKUP_FILE}")
-    
-    # Read current HTML
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find and replace the gallery section
-    # Looking for featured works or tabbed gallery section
-    # Try to find existing sections first
-    if '    <!-- Featured Works Section -->' in content:
-        start_marker = '    <!-- Featured Works Section -->'
-    elif '    <!-- Tabbed Gallery Section -->' in content:
-        start_marker = '    <!-- Tabbed Gallery Section -->'
-    else:
-        start_marker = '    <!-- Gallery Section -->'
-    
-    end_marker = '    <!-- Contact Section -->'
-    
-    start_idx = content.find(start_marker)
-    end_idx = content.find(end_marker)
-    
-    if start_idx == -1 or end_idx == -1:
-        print("❌ Error: Could not find gallery section markers in HTML!")
-        return False
-    
-    # Build new gallery sections
-    new_sections = featured_html + '\n' + gallery_html + '\n\n'
-    
-    # Replace content
-    new_content = (
-        content[:start_idx] +
-        new_sections +
-        content[end_idx:]
-    )
-    
-    # Write updated HTML
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    
-    print(f"✅ Updated {html_file} with featured section and tabbed gallery!")
-    return True
+# Candidate gallery-section start markers, most likely first
+SECTION_MARKERS = ('    <!-- Featured Works Section -->',
+                   '    <!-- Tabbed Gallery Section -->',
+                   '    <!-- Gallery Section -->')
 
-def update_css_styles(html_file):
-    """Add/update CSS for featured section and tabs."""
-    
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Check if our new styles already exist
-    if '.featured-gallery' in content:
-        print("✅ CSS styles already present")
-        return
-    
-    # Find where to insert new CSS (after the existing gallery styles)
-    insert_after = '        /* Gallery Section */'
-    
-    new_css = '''
+# CSS and JS payloads inserted into index.html, defined once at module
+# scope rather than rebuilt inside the update helpers on every call
+CSS_BLOCK = '''
         /* Featured Works Section */
         .featured-gallery {
             padding: 8rem 5%;
@@ -329,30 +152,8 @@ def update_css_styles(html_file):
         }
 
         '''
-    
-    # Insert the new CSS
-    new_content = content.replace(insert_after, insert_after + new_css)
-    
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    
-    print("✅ Added featured gallery and tab CSS styles")
 
-def add_tab_javascript(html_file):
-    """Add JavaScript for tab switching functionality."""
-    
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Check if function already exists
-    if 'function showTab(' in content:
-        print("✅ Tab JavaScript already present")
-        return
-    
-    # Find the script section (before closing </script> tag near the end)
-    script_marker = '        // Smooth scrolling for navigation'
-    
-    tab_js = '''
+JS_BLOCK = '''
         // Tab switching functionality
         function showTab(tabName) {
             // Hide all tab contents
@@ -386,13 +187,361 @@ def add_tab_javascript(html_file):
         });
 
         '''
+
+def read_paintings_data(csv_path):
+    """Read painting data from CSV file."""
+    paintings = []
+    
+    if not os.path.exists(csv_path):
+        print(f"❌ Error: {csv_path} not found!")
+        print("Please create the CSV file with your painting data first.")
+        return None
+    
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            print(f"✅ Read 0 paintings from {csv_path}")
+            return paintings
+
+        # Resolve column positions once; each row is then plain list indexing
+        # instead of the per-row dict DictReader would build and key into.
+        columns = {name: pos for pos, name in enumerate(header)}
+        i_title = columns['title']
+        i_location = columns['location']
+        i_filename = columns['filename']
+        i_medium = columns['medium']
+        i_price = columns['price']
+        i_description = columns['description']
+        i_featured = columns.get('featured', -1)
+
+        for row in reader:
+            if not row:
+                continue  # blank line; csv.DictReader used to skip these
+            paintings.append({
+                'title': row[i_title].strip(),
+                'location': row[i_location].strip().lower(),
+                'filename': row[i_filename].strip(),
+                'medium': row[i_medium].strip(),
+                'price': row[i_price].strip(),
+                'description': row[i_description].strip(),
+                'featured': i_featured >= 0 and row[i_featured].strip().lower() == 'yes'
+            })
+    
+    print(f"✅ Read {len(paintings)} paintings from {csv_path}")
+    return paintings
+
+def scan_image_dirs():
+    """Map each location to a {filename: mtime_ns} dict of its images.
+
+    One scandir per location instead of a stat syscall per row; the
+    DirEntry stat rides along with the directory read, so each image's
+    mtime is captured for cache-busting URLs at no extra syscall cost.
+    """
+    existing = {}
+    for loc in VALID_LOCATIONS:
+        try:
+            existing[loc] = {e.name: e.stat().st_mtime_ns
+                             for e in os.scandir(f"images/paintings/{loc}")
+                             if e.is_file()}
+        except FileNotFoundError:
+            existing[loc] = {}
+    return existing
+
+def stamp_image_versions(paintings, existing):
+    """Stamp each row whose image exists with the image's mtime."""
+    for painting in paintings:
+        version = existing.get(painting['location'], {}).get(painting['filename'])
+        if version:
+            painting['image_v'] = version
+
+def load_validation_cache():
+    """Hashes of CSVs that already passed validation, oldest first."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict) and isinstance(cache.get('validated'), list):
+            return cache['validated']
+    except (OSError, ValueError):
+        pass
+    return []
+
+def record_validated(csv_hash):
+    """Remember csv_hash as validated, keeping the most recent entries."""
+    hashes = [h for h in load_validation_cache() if h != csv_hash]
+    hashes.append(csv_hash)
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'validated': hashes[-CACHE_MAX_ENTRIES:]}, f)
+    except OSError:
+        pass
+
+def validate_paintings_data(paintings, strict=False):
+    """Validate that all required data is present and image files exist.
+
+    Problems are buffered and written to stdout in one batch instead of
+    printed row by row; strict=True stops at the first failing row.
+    """
+    errors = []
+    
+    existing = scan_image_dirs()
+    
+    for i, painting in enumerate(paintings, 1):
+        # Check required fields; all() short-circuits on the common good
+        # row, and only failing rows take the per-field message loop
+        if not all(painting.get(f) for f in REQUIRED_FIELDS):
+            for field in REQUIRED_FIELDS:
+                if not painting.get(field):
+                    errors.append(f"❌ Row {i}: Missing {field}")
+        
+        # Validate location
+        if painting['location'] not in VALID_LOCATIONS:
+            errors.append(f"❌ Row {i}: Invalid location '{painting['location']}' (must be boston, delaware, or misc)")
+        
+        # Check if image file exists (set lookup against the listing above)
+        if painting['filename'] not in existing.get(painting['location'], ()):
+            image_path = f"images/paintings/{painting['location']}/{painting['filename']}"
+            errors.append(f"⚠️  Row {i}: Image not found: {image_path}\n"
+                          f"   Make sure the file exists and the filename in CSV matches exactly!")
+        else:
+            # Stamp the image mtime so the card URL busts stale caches
+            painting['image_v'] = existing[painting['location']][painting['filename']]
+        
+        if errors and strict:
+            break
+    
+    if errors:
+        # One stdout write instead of a flush per problem row
+        sys.stdout.write('\n'.join(errors) + '\n')
+        return False
+    
+    print("✅ All paintings data validated successfully!")
+    return True
+
+# Card markup defined once at import time with positional fields: each call
+# is a single C-level str.format with no per-card kwargs dict to build.
+# Fields: 0=card class, 1=location, 2=filename, 3=title, 4=medium,
+# 5=description, 6=price, 7=title as a JS string literal for the onclick,
+# 8=cache-busting query suffix for the image URL.
+CARD_TEMPLATE = '''
+            <div class="{0}">
+                <div class="painting-image" style="background-image: url('images/paintings/{1}/{2}{8}'); background-size: cover; background-position: center;"></div>
+                <div class="painting-info">
+                    <h3>{3}</h3>
+                    <p class="medium">{4}</p>
+                    <p class="description">{5}</p>
+                    <div class="price-tag">From ${6}</div>
+                    <button class="order-button" onclick="openOrderModal({7}, {6})">ORDER PRINT</button>
+                </div>
+            </div>'''
+
+def generate_painting_card(painting, card_class="painting-card"):
+    """Generate HTML for a single painting card.
+
+    Text fields are HTML-escaped; the onclick title goes through
+    json.dumps for JS quoting and is then entity-escaped for the
+    attribute context. Rows stamped with an image mtime by validation
+    get a ?v= suffix on the image URL so browsers refetch changed files.
+    """
+    image_v = painting.get('image_v')
+    return CARD_TEMPLATE.format(card_class, painting['location'],
+                                painting['filename'],
+                                painting['title'].translate(ESCAPE_TABLE),
+                                painting['medium'].translate(ESCAPE_TABLE),
+                                painting['description'].translate(ESCAPE_TABLE),
+                                painting['price'],
+                                json.dumps(painting['title']).translate(ESCAPE_TABLE),
+                                f'?v={image_v}' if image_v else '')
+
+def generate_featured_section(paintings):
+    """Generate HTML for Featured Works section."""
+    featured = [p for p in paintings if p['featured']]
+    
+    if not featured:
+        print("⚠️  No featured paintings found. Skipping featured section.")
+        return ""
+    
+    cards_html = '\n'.join(generate_painting_card(p, "painting-card featured-card") for p in featured)
+    
+    section_html = f'''
+    <!-- Featured Works Section -->
+    <section class="featured-gallery">
+        <h2>Featured Works</h2>
+        <div class="featured-grid">
+{cards_html}
+        </div>
+    </section>
+'''
+    
+    print(f"✅ Generated Featured Works section with {len(featured)} paintings")
+    return section_html
+
+def generate_tabbed_gallery(paintings):
+    """Generate HTML for tabbed gallery organized by location."""
+    
+    # Group paintings by location in one pass instead of filtering the
+    # full list once per category
+    by_location = {'boston': [], 'delaware': [], 'misc': []}
+    for p in paintings:
+        by_location[p['location']].append(p)
+    
+    # Generate tab content for each category
+    tab_contents = []
+    for loc_key in ['boston', 'delaware', 'misc']:
+        paintings_list = by_location[loc_key]
+        if not paintings_list:
+            continue
+            
+        cards_html = '\n'.join(generate_painting_card(p) for p in paintings_list)
+        
+        tab_contents.append(f'''
+            <div class="tab-content" id="{loc_key}-tab" style="display: none;">
+                <div class="gallery-grid">
+{cards_html}
+                </div>
+            </div>''')
+    
+    # Combine into full gallery section
+    gallery_html = f'''
+    <!-- Tabbed Gallery Section -->
+    <section class="gallery" id="gallery">
+        <h2>Browse Collection</h2>
+        
+        <div class="tab-navigation">
+            <button class="tab-button active" onclick="showTab('boston')">Boston, MA</button>
+            <button class="tab-button" onclick="showTab('delaware')">Delaware, OH</button>
+            <button class="tab-button" onclick="showTab('misc')">Other Pieces</button>
+        </div>
+
+{''.join(tab_contents)}
+    </section>
+'''
+    
+    counts = {k: len(v) for k, v in by_location.items()}
+    print(f"✅ Generated tabbed gallery: Boston ({counts['boston']}), Delaware ({counts['delaware']}), Other ({counts['misc']})")
+    
+    return gallery_html
+
+def csv_digest(csv_path):
+    """Hash of the CSV bytes, used to detect content-identical reruns."""
+    with open(csv_path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def is_up_to_date(csv_path, html_file, csv_hash):
+    """Check whether html_file already reflects csv_path.
+
+    The page only counts as up to date if it carries the gallery-csv-hash
+    comment proving a previous generation run -- a fresh template or a
+    page restored from backup must never skip generation. Given that,
+    the fast path is the CSV not being modified since the page was
+    written; the slow path compares the embedded hash, so a touched but
+    content-identical CSV (e.g. after a git checkout) still skips.
+    """
+    try:
+        csv_newer = os.stat(csv_path).st_mtime_ns > os.stat(html_file).st_mtime_ns
+        with open(html_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return False
     
-    new_content = content.replace(script_marker, tab_js + '\n        ' + script_marker)
+    marker = '<!-- gallery-csv-hash: '
+    idx = content.find(marker)
+    if idx == -1:
+        return False
+    if not csv_newer:
+        return True
+    idx += len(marker)
+    return content[idx:content.find(' -->', idx)] == csv_hash
+
+def update_html_all(html_file, featured_html, gallery_html, csv_hash=None):
+    """Update index.html in one read/write cycle: sections, CSS, and JS."""
     
-    with open(html_file, 'w', encoding='utf-8') as f:
+    # Create backup as a hard link: one metadata syscall, no data copy
+    if os.path.exists(html_file):
+        try:
+            if os.path.exists(BACKUP_FILE):
+                os.unlink(BACKUP_FILE)
+            os.link(html_file, BACKUP_FILE)
+        except OSError:
+            shutil.copy(html_file, BACKUP_FILE)  # filesystems without link support
+        print(f"✅ Created backup: {BACKUP_FILE}")
+    
+    # Read current HTML once; every transformation below chains in memory
+    # and the result is written back in a single pass.
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Find and replace the gallery section
+    # Probe for existing sections with one find per candidate marker; the
+    # old 'marker in content' tests doubled every scan.
+    start_idx = -1
+    for start_marker in SECTION_MARKERS:
+        start_idx = content.find(start_marker)
+        if start_idx != -1:
+            break
+    
+    end_marker = '    <!-- Contact Section -->'
+    
+    # The end marker always follows the start, so bound the second scan
+    end_idx = content.find(end_marker, start_idx + 1)
+    
+    if start_idx == -1 or end_idx == -1:
+        print("❌ Error: Could not find gallery section markers in HTML!")
+        return False
+    
+    # Build new gallery sections; the hash comment records which CSV the
+    # page was generated from so unchanged reruns can skip early
+    new_sections = featured_html + '\n' + gallery_html + '\n'
+    if csv_hash:
+        new_sections += f'    <!-- gallery-csv-hash: {csv_hash} -->\n'
+    new_sections += '\n'
+    
+    print(f"✅ Updated {html_file} with featured section and tabbed gallery!")
+    
+    # Locate the CSS and JS insertion points up front, then assemble the
+    # final page with one join. The old pipeline spliced the sections,
+    # CSS, and JS in three passes, copying the full page each time; this
+    # emits every byte of the result exactly once. The page is laid out
+    # with the style block above the gallery and the script below it.
+    css_i = -1
+    if '.featured-gallery' in content:
+        print("✅ CSS styles already present")
+    else:
+        insert_after = '        /* Gallery Section */'
+        css_i = content.find(insert_after)
+        if css_i != -1:
+            css_i += len(insert_after)
+    
+    js_i = -1
+    if 'function showTab(' in content:
+        print("✅ Tab JavaScript already present")
+    else:
+        js_i = content.find('        // Smooth scrolling for navigation')
+    
+    parts = []
+    pos = 0
+    if 0 <= css_i <= start_idx:
+        parts.extend((content[:css_i], CSS_BLOCK))
+        pos = css_i
+        print("✅ Added featured gallery and tab CSS styles")
+    parts.extend((content[pos:start_idx], new_sections))
+    pos = end_idx
+    if js_i >= end_idx:
+        parts.extend((content[pos:js_i], JS_BLOCK, '\n        '))
+        pos = js_i
+        print("✅ Added tab switching JavaScript")
+    parts.append(content[pos:])
+    new_content = ''.join(parts)
+    
+    # Write updated HTML once, after all transformations. Writing a temp
+    # file and renaming swaps in a fresh inode, so the hard-linked backup
+    # keeps the old contents instead of being truncated with the original.
+    tmp_file = html_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
         f.write(new_content)
+    os.replace(tmp_file, html_file)
     
-    print("✅ Added tab switching JavaScript")
+    return True
 
 def main():
     """Main execution function."""
@@ -401,6 +550,14 @@ def main():
     print("  Featured Works + Tabbed Gallery")
     print("="*60 + "\n")
     
+    # Step 0: Cache check - skip the whole pipeline on an unchanged CSV
+    csv_hash = None
+    if os.path.exists(CSV_FILE):
+        csv_hash = csv_digest(CSV_FILE)
+        if '--force' not in sys.argv and is_up_to_date(CSV_FILE, HTML_FILE, csv_hash):
+            print("✅ index.html is already up to date. Use --force to regenerate.")
+            return
+    
     # Step 1: Read CSV data
     paintings = read_paintings_data(CSV_FILE)
     if paintings is None:
@@ -410,9 +567,17 @@ def main():
         print("❌ No paintings found in CSV. Please add your painting data first.")
         return
     
-    # Step 2: Validate data
+    # Step 2: Validate data, unless this exact CSV already passed once.
+    # The image-mtime stamps for cache-busting URLs are still applied on
+    # the skip path: three directory reads, no per-row checks.
     print("\n--- Validating Data ---")
-    if not validate_paintings_data(paintings):
+    if csv_hash and csv_hash in load_validation_cache() and '--force' not in sys.argv:
+        print("✅ Validation skipped: this CSV already passed. Use --force to re-check.")
+        stamp_image_versions(paintings, scan_image_dirs())
+    elif validate_paintings_data(paintings, strict='--strict' in sys.argv):
+        if csv_hash:
+            record_validated(csv_hash)
+    else:
         print("\n❌ Validation failed. Please fix the issues above and try again.")
         return
     
@@ -421,20 +586,22 @@ def main():
     featured_html = generate_featured_section(paintings)
     gallery_html = generate_tabbed_gallery(paintings)
     
-    # Step 4: Update HTML file
+    # Steps 4-5: Update HTML file (sections, CSS, JavaScript) in one pass
     print("\n--- Updating index.html ---")
-    if not update_html_file(HTML_FILE, featured_html, gallery_html):
+    if not update_html_all(HTML_FILE, featured_html, gallery_html, csv_hash):
         return
     
-    # Step 5: Update CSS and JavaScript
-    update_css_styles(HTML_FILE)
-    add_tab_javascript(HTML_FILE)
-    
-    # Step 6: Summary
-    featured_count = sum(1 for p in paintings if p['featured'])
-    boston_count = sum(1 for p in paintings if p['location'] == 'boston')
-    delaware_count = sum(1 for p in paintings if p['location'] == 'delaware')
-    misc_count = sum(1 for p in paintings if p['location'] == 'misc')
+    # Step 6: Summary (one pass over the list instead of four)
+    featured_count = boston_count = delaware_count = misc_count = 0
+    for p in paintings:
+        if p['featured']:
+            featured_count += 1
+        if p['location'] == 'boston':
+            boston_count += 1
+        elif p['location'] == 'delaware':
+            delaware_count += 1
+        elif p['location'] == 'misc':
+            misc_count += 1
     
     print("\n" + "="*60)
     print("✅ SUCCESS! Gallery updated with featured section and tabs.")